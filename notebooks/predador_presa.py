@@ -28,12 +28,20 @@
 from typing import Tuple, List
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from scipy.integrate import solve_ivp
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 11
+plt.style.use([
+    'seaborn-v0_8-darkgrid',
+    {
+        'figure.figsize': (12, 8),
+        'font.size': 11,
+        'text.usetex': False,
+        'mathtext.default': 'regular',
+    },
+])
 
 
 # %% [markdown]
@@ -47,7 +55,7 @@ def lotka_volterra(
         beta: float,
         gamma: float,
         delta: float
-) -> List[float]:
+) -> NDArray[np.float64]:
     """
     Sistema de equações diferenciais do modelo Lotka-Volterra.
 
@@ -69,13 +77,13 @@ def lotka_volterra(
 
     Returns
     -------
-    List[float]
+    NDArray
         Derivadas [dx1/dt, dx2/dt]
     """
     x1, x2 = y
     dx1_dt = alpha * x1 - beta * x1 * x2
     dx2_dt = -gamma * x2 + delta * x1 * x2
-    return [dx1_dt, dx2_dt]
+    return np.array((dx1_dt, dx2_dt))
 
 
 def resolver_sistema(
@@ -126,21 +134,26 @@ def resolver_sistema(
         y0,
         args=(alpha, beta, gamma, delta),
         t_eval=t_eval,
-        method='RK45',
-        dense_output=True
+        method='RK45'
     )
 
     return sol.t, sol.y[0], sol.y[1]
 
 
-def calcular_equilibrio(
+def resolver_sistema_com_caca(
         alpha: float,
         beta: float,
         gamma: float,
-        delta: float
-) -> Tuple[float, float]:
+        delta: float,
+        x1_0: float,
+        x2_0: float,
+        t_caca: float,
+        fator_x2: float,
+        t_max: float = 50.0,
+        n_points: int = 1000
+) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
     """
-    Calcula o ponto de equilíbrio não-trivial do sistema.
+    Resolve o sistema com uma redução instantânea dos predadores em t_caca.
 
     Parameters
     ----------
@@ -152,17 +165,183 @@ def calcular_equilibrio(
         Taxa de mortalidade dos predadores
     delta : float
         Eficiência de conversão
+    x1_0 : float
+        População inicial de presas
+    x2_0 : float
+        População inicial de predadores
+    t_caca : float
+        Instante da caça, entre 0 e t_max
+    fator_x2 : float
+        Fator aplicado a x2 em t_caca (0.7 remove 30% dos predadores)
+    t_max : float, optional
+        Tempo final de simulação (padrão: 50.0)
+    n_points : int, optional
+        Número de pontos da malha de avaliação (padrão: 1000)
 
     Returns
     -------
-    Tuple[float, float]
+    Tuple[NDArray, NDArray, NDArray]
+        Tupla (t, x1, x2) com t_caca repetido: a primeira ocorrência tem o
+        estado antes da caça e a segunda, o estado depois dela
+    """
+    t_grade = np.linspace(0.0, t_max, n_points)
+    t_antes = np.append(t_grade[t_grade < t_caca], t_caca)
+    t_depois = np.insert(t_grade[t_grade > t_caca], 0, t_caca)
+    args = (alpha, beta, gamma, delta)
+
+    sol_antes = solve_ivp(lotka_volterra, (0.0, t_caca), [x1_0, x2_0],
+                          args=args, t_eval=t_antes, method='RK45')
+    y_caca = [sol_antes.y[0, -1], sol_antes.y[1, -1] * fator_x2]
+    sol_depois = solve_ivp(lotka_volterra, (t_caca, t_max), y_caca,
+                           args=args, t_eval=t_depois, method='RK45')
+
+    t = np.concatenate((sol_antes.t, sol_depois.t))
+    x1 = np.concatenate((sol_antes.y[0], sol_depois.y[0]))
+    x2 = np.concatenate((sol_antes.y[1], sol_depois.y[1]))
+    return t, x1, x2
+
+
+def lotka_volterra_lote(
+        t: float,
+        y: NDArray[np.float64],
+        params: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Sistema Lotka-Volterra para N conjuntos de parâmetros integrados juntos.
+
+    Parameters
+    ----------
+    t : float
+        Tempo atual
+    y : NDArray
+        Vetor de estado de tamanho 2N: as N populações de presas seguidas
+        das N populações de predadores
+    params : NDArray
+        Array de forma (N, 4) com as linhas (alpha, beta, gamma, delta)
+
+    Returns
+    -------
+    NDArray
+        Derivadas no mesmo formato de y
+    """
+    n = params.shape[0]
+    x1, x2 = y[:n], y[n:]
+    alpha, beta, gamma, delta = params.T
+    return np.concatenate((alpha * x1 - beta * x1 * x2,
+                           -gamma * x2 + delta * x1 * x2))
+
+
+def resolver_sistema_lote(
+        params: NDArray[np.float64],
+        y0: Tuple[float, float],
+        t_max: float = 50.0,
+        n_points: int = 1000
+) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Resolve vários sistemas independentes em uma única chamada ao integrador.
+
+    Parameters
+    ----------
+    params : NDArray
+        Array de forma (N, 4) com as linhas (alpha, beta, gamma, delta)
+    y0 : Tuple[float, float]
+        Condição inicial (x1_0, x2_0) comum a todos os sistemas
+    t_max : float, optional
+        Tempo final de simulação (padrão: 50.0)
+    n_points : int, optional
+        Número de pontos para avaliação (padrão: 1000)
+
+    Returns
+    -------
+    Tuple[NDArray, NDArray, NDArray]
+        Tupla contendo (t, x1, x2) onde x1 e x2 têm forma (N, n_points)
+    """
+    params = np.asarray(params, dtype=np.float64)
+    n = params.shape[0]
+    y0_lote = np.repeat(np.asarray(y0, dtype=np.float64), n)
+    t_eval = np.linspace(0.0, t_max, n_points)
+
+    sol = solve_ivp(
+        lotka_volterra_lote,
+        (0.0, t_max),
+        y0_lote,
+        args=(params,),
+        t_eval=t_eval,
+        method='RK45'
+    )
+
+    return sol.t, sol.y[:n], sol.y[n:]
+
+
+def calcular_equilibrio(
+        alpha: ArrayLike,
+        beta: ArrayLike,
+        gamma: ArrayLike,
+        delta: ArrayLike
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Calcula o ponto de equilíbrio não-trivial do sistema.
+
+    Aceita escalares ou arrays de parâmetros.
+
+    Parameters
+    ----------
+    alpha : ArrayLike
+        Taxa de crescimento das presas
+    beta : ArrayLike
+        Taxa de predação
+    gamma : ArrayLike
+        Taxa de mortalidade dos predadores
+    delta : ArrayLike
+        Eficiência de conversão
+
+    Returns
+    -------
+    Tuple[NDArray, NDArray]
         Tupla (x1_eq, x2_eq) com as populações de equilíbrio
     """
-    x1_eq = gamma / delta
-    x2_eq = alpha / beta
+    x1_eq = np.asarray(gamma) / np.asarray(delta)
+    x2_eq = np.asarray(alpha) / np.asarray(beta)
     return x1_eq, x2_eq
 
 
+def calcular_invariante(
+        alpha: float,
+        beta: float,
+        gamma: float,
+        delta: float,
+        x1: NDArray[np.float64],
+        x2: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Calcula a quantidade conservada H do sistema.
+
+    H(x1, x2) = δ·x1 − γ·ln(x1) + β·x2 − α·ln(x2) é constante ao longo de
+    cada trajetória, então as órbitas são as curvas de nível de H.
+
+    Parameters
+    ----------
+    alpha : float
+        Taxa de crescimento das presas
+    beta : float
+        Taxa de predação
+    gamma : float
+        Taxa de mortalidade dos predadores
+    delta : float
+        Eficiência de conversão
+    x1 : NDArray
+        População(ões) de presas, estritamente positiva(s)
+    x2 : NDArray
+        População(ões) de predadores, estritamente positiva(s)
+
+    Returns
+    -------
+    NDArray
+        Valor de H em cada ponto
+    """
+    return delta * x1 - gamma * np.log(x1) + beta * x2 - alpha * np.log(x2)
+
+
 # %% [markdown]
 # ## Simulação com Parâmetros Padrão
 #
@@ -237,12 +416,12 @@ ax.plot(x1_0, x2_0, 'go', markersize=15, label='Início', zorder=5)
 ax.plot(x1_eq, x2_eq, 'r*', markersize=20, label='Equilíbrio', zorder=5)
 
 n_arrows: int = 8
-for i in range(0, len(t), len(t) // n_arrows):
-    if i < len(t) - 1:
-        dx = x1[i + 1] - x1[i]
-        dy = x2[i + 1] - x2[i]
-        ax.arrow(x1[i], x2[i], dx * 0.3, dy * 0.3, head_width=0.05,
-                 head_length=0.05, fc='black', ec='black', alpha=0.5)
+idx = np.arange(0, len(t) - 1, len(t) // n_arrows)
+dx = x1[idx + 1] - x1[idx]
+dy = x2[idx + 1] - x2[idx]
+norma = np.hypot(dx, dy)
+ax.quiver(x1[idx], x2[idx], dx / norma, dy / norma, angles='xy', scale_units='width',
+          scale=30, pivot='mid', color='black', alpha=0.5, zorder=4)
 
 ax.set_xlabel('População de Presas (x₁)', fontsize=14, fontweight='bold')
 ax.set_ylabel('População de Predadores (x₂)', fontsize=14, fontweight='bold')
@@ -264,146 +443,114 @@ plt.show()
 # ## Análise de Sensibilidade
 #
 # Análise de como a variação de cada parâmetro afeta o comportamento do sistema.
-
-# %% [markdown]
-# ### Variação de α (Taxa de Crescimento das Presas)
+# Para cada parâmetro, as quatro simulações são desenhadas no mesmo gráfico:
+# linhas cheias para presas, tracejadas para predadores e pontilhadas para
+# os equilíbrios, com uma cor por valor do parâmetro.
 
 # %%
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-alphas: List[float] = [3.0, 6.0, 9.0, 12.0]
-colors: List[str] = ['blue', 'green', 'orange', 'red']
-
-for idx, (alpha_var, color) in enumerate(zip(alphas, colors)):
-    ax = axes[idx // 2, idx % 2]
-
-    t_var, x1_var, x2_var = resolver_sistema(alpha_var, beta, gamma, delta, x1_0, x2_0, t_max)
-    x1_eq_var, x2_eq_var = calcular_equilibrio(alpha_var, beta, gamma, delta)
+def plotar_sensibilidade(
+        ax: plt.Axes,
+        t: NDArray[np.float64],
+        x1_lote: NDArray[np.float64],
+        x2_lote: NDArray[np.float64],
+        params_lote: NDArray[np.float64],
+        coluna: int,
+        simbolo: str,
+        cores: List[str]
+) -> None:
+    """
+    Desenha uma varredura de parâmetro em um único eixo com LineCollection.
 
-    ax.plot(t_var, x1_var, color=color, linewidth=2, label='Presas', alpha=0.8)
-    ax.plot(t_var, x2_var, color=color, linewidth=2, linestyle='--', label='Predadores', alpha=0.8)
-    ax.axhline(y=x1_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
-    ax.axhline(y=x2_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
+    Parameters
+    ----------
+    ax : plt.Axes
+        Eixo onde as curvas serão desenhadas
+    t : NDArray
+        Vetor de tempos comum a todas as simulações
+    x1_lote, x2_lote : NDArray
+        Populações de forma (N, n_points) retornadas por resolver_sistema_lote
+    params_lote : NDArray
+        Array (N, 4) com os parâmetros (alpha, beta, gamma, delta) de cada simulação
+    coluna : int
+        Índice da coluna de params_lote que está sendo variada
+    simbolo : str
+        Símbolo do parâmetro variado, usado na legenda
+    cores : List[str]
+        Uma cor por simulação
+    """
+    x1_eqs, x2_eqs = calcular_equilibrio(*params_lote.T)
+
+    ax.add_collection(LineCollection(
+        [np.column_stack((t, x1)) for x1 in x1_lote],
+        colors=cores, linewidths=2, alpha=0.8
+    ))
+    ax.add_collection(LineCollection(
+        [np.column_stack((t, x2)) for x2 in x2_lote],
+        colors=cores, linewidths=2, linestyles='--', alpha=0.8
+    ))
+    ax.hlines(x1_eqs, t[0], t[-1], colors=cores, linestyles=':', linewidth=1, alpha=0.5)
+    ax.hlines(x2_eqs, t[0], t[-1], colors=cores, linestyles=':', linewidth=1, alpha=0.5)
+    ax.autoscale_view()
+
+    handles = [
+        Line2D([], [], color=cor, linewidth=2,
+               label=f'{simbolo} = {valor:.1f} (Eq: x₁={x1_eq:.2f}, x₂={x2_eq:.2f})')
+        for cor, valor, x1_eq, x2_eq in zip(cores, params_lote[:, coluna], x1_eqs, x2_eqs)
+    ]
+    handles += [
+        Line2D([], [], color='gray', linewidth=2, label='Presas'),
+        Line2D([], [], color='gray', linewidth=2, linestyle='--', label='Predadores'),
+    ]
 
     ax.set_xlabel('Tempo (t)', fontsize=12)
     ax.set_ylabel('População', fontsize=12)
-    ax.set_title(f'α = {alpha_var:.1f} (Eq: x₁={x1_eq_var:.2f}, x₂={x2_eq_var:.2f})',
-                 fontsize=13, fontweight='bold')
-    ax.legend(fontsize=10)
+    ax.legend(handles=handles, fontsize=10)
     ax.grid(True, alpha=0.3)
 
-plt.suptitle('Sensibilidade ao Parâmetro α (Taxa de Crescimento das Presas)',
-             fontsize=16, fontweight='bold', y=1.00)
-plt.tight_layout()
-plt.show()
 
 # %% [markdown]
-# Conclusão: Aumentar α (crescimento de presas) aumenta a população de equilíbrio de predadores (x₂).
-
-# %% [markdown]
-# ### Variação de β (Taxa de Predação)
+# ### Variação de α, β, γ e δ
+#
+# Cada painel varia um parâmetro mantendo os demais nos valores padrão:
+# - **α**: Taxa de crescimento das presas
+# - **β**: Taxa de predação
+# - **γ**: Taxa de mortalidade dos predadores
+# - **δ**: Eficiência de conversão
 
 # %%
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
+alphas: List[float] = [3.0, 6.0, 9.0, 12.0]
 betas: List[float] = [1.0, 2.0, 3.0, 4.0]
-colors: List[str] = ['blue', 'green', 'orange', 'red']
-
-for idx, (beta_var, color) in enumerate(zip(betas, colors)):
-    ax = axes[idx // 2, idx % 2]
-
-    t_var, x1_var, x2_var = resolver_sistema(alpha, beta_var, gamma, delta, x1_0, x2_0, t_max)
-    x1_eq_var, x2_eq_var = calcular_equilibrio(alpha, beta_var, gamma, delta)
-
-    ax.plot(t_var, x1_var, color=color, linewidth=2, label='Presas', alpha=0.8)
-    ax.plot(t_var, x2_var, color=color, linewidth=2, linestyle='--', label='Predadores', alpha=0.8)
-    ax.axhline(y=x1_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
-    ax.axhline(y=x2_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
-
-    ax.set_xlabel('Tempo (t)', fontsize=12)
-    ax.set_ylabel('População', fontsize=12)
-    ax.set_title(f'β = {beta_var:.1f} (Eq: x₁={x1_eq_var:.2f}, x₂={x2_eq_var:.2f})',
-                 fontsize=13, fontweight='bold')
-    ax.legend(fontsize=10)
-    ax.grid(True, alpha=0.3)
-
-plt.suptitle('Sensibilidade ao Parâmetro β (Taxa de Predação)',
-             fontsize=16, fontweight='bold', y=1.00)
-plt.tight_layout()
-plt.show()
-
-# %% [markdown]
-# Conclusão: Aumentar \beta (predação) diminui a população de equilíbrio de predadores (x₂).
-
-# %% [markdown]
-# ### Variação de γ (Taxa de Mortalidade dos Predadores)
-
-# %%
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
 gammas: List[float] = [1.0, 2.0, 3.0, 4.0]
-colors: List[str] = ['blue', 'green', 'orange', 'red']
-
-for idx, (gamma_var, color) in enumerate(zip(gammas, colors)):
-    ax = axes[idx // 2, idx % 2]
-
-    t_var, x1_var, x2_var = resolver_sistema(alpha, beta, gamma_var, delta, x1_0, x2_0, t_max)
-    x1_eq_var, x2_eq_var = calcular_equilibrio(alpha, beta, gamma_var, delta)
-
-    ax.plot(t_var, x1_var, color=color, linewidth=2, label='Presas', alpha=0.8)
-    ax.plot(t_var, x2_var, color=color, linewidth=2, linestyle='--', label='Predadores', alpha=0.8)
-    ax.axhline(y=x1_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
-    ax.axhline(y=x2_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
-
-    ax.set_xlabel('Tempo (t)', fontsize=12)
-    ax.set_ylabel('População', fontsize=12)
-    ax.set_title(f'γ = {gamma_var:.1f} (Eq: x₁={x1_eq_var:.2f}, x₂={x2_eq_var:.2f})',
-                 fontsize=13, fontweight='bold')
-    ax.legend(fontsize=10)
-    ax.grid(True, alpha=0.3)
-
-plt.suptitle('Sensibilidade ao Parâmetro γ (Mortalidade dos Predadores)',
-             fontsize=16, fontweight='bold', y=1.00)
-plt.tight_layout()
-plt.show()
-
-# %% [markdown]
-# Conclusão: Aumentar γ (mortalidade de predadores) aumenta a população de equilíbrio de presas (x₁).
-
-# %% [markdown]
-# ### Variação de δ (Eficiência de Conversão)
-
-# %%
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
 deltas: List[float] = [1.5, 3.0, 4.5, 6.0]
 colors: List[str] = ['blue', 'green', 'orange', 'red']
 
-for idx, (delta_var, color) in enumerate(zip(deltas, colors)):
-    ax = axes[idx // 2, idx % 2]
+varreduras: List[Tuple[str, List[float], str]] = [
+    ('α', alphas, 'Taxa de Crescimento das Presas'),
+    ('β', betas, 'Taxa de Predação'),
+    ('γ', gammas, 'Mortalidade dos Predadores'),
+    ('δ', deltas, 'Eficiência de Conversão'),
+]
 
-    t_var, x1_var, x2_var = resolver_sistema(alpha, beta, gamma, delta_var, x1_0, x2_0, t_max)
-    x1_eq_var, x2_eq_var = calcular_equilibrio(alpha, beta, gamma, delta_var)
+fig, axes = plt.subplots(2, 2, figsize=(20, 14))
 
-    ax.plot(t_var, x1_var, color=color, linewidth=2, label='Presas', alpha=0.8)
-    ax.plot(t_var, x2_var, color=color, linewidth=2, linestyle='--', label='Predadores', alpha=0.8)
-    ax.axhline(y=x1_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
-    ax.axhline(y=x2_eq_var, color=color, linestyle=':', linewidth=1, alpha=0.5)
+for coluna, ((simbolo, valores, descricao), ax) in enumerate(zip(varreduras, axes.flat)):
+    params_lote = np.tile([alpha, beta, gamma, delta], (len(valores), 1))
+    params_lote[:, coluna] = valores
+    t_var, x1_lote, x2_lote = resolver_sistema_lote(params_lote, (x1_0, x2_0), t_max)
 
-    ax.set_xlabel('Tempo (t)', fontsize=12)
-    ax.set_ylabel('População', fontsize=12)
-    ax.set_title(f'δ = {delta_var:.1f} (Eq: x₁={x1_eq_var:.2f}, x₂={x2_eq_var:.2f})',
-                 fontsize=13, fontweight='bold')
-    ax.legend(fontsize=10)
-    ax.grid(True, alpha=0.3)
+    plotar_sensibilidade(ax, t_var, x1_lote, x2_lote, params_lote, coluna, simbolo, colors)
+    ax.set_title(f'{simbolo} ({descricao})', fontsize=14, fontweight='bold')
 
-plt.suptitle('Sensibilidade ao Parâmetro δ (Eficiência de Conversão)',
-             fontsize=16, fontweight='bold', y=1.00)
+plt.suptitle('Sensibilidade aos Parâmetros', fontsize=16, fontweight='bold')
 plt.tight_layout()
 plt.show()
 
 # %% [markdown]
-# Conclusão: Aumentar δ (eficiência) diminui a população de equilíbrio de presas (x₁).
+# Conclusões:
+# - Aumentar α (crescimento de presas) aumenta a população de equilíbrio de predadores (x₂).
+# - Aumentar β (predação) diminui a população de equilíbrio de predadores (x₂).
+# - Aumentar γ (mortalidade de predadores) aumenta a população de equilíbrio de presas (x₁).
+# - Aumentar δ (eficiência) diminui a população de equilíbrio de presas (x₁).
 
 # %% [markdown]
 # ## Comparação de Diferentes Condições Iniciais
@@ -418,8 +565,12 @@ initial_conditions: List[Tuple[float, float, str]] = [
     (x1_eq, x2_eq, 'purple')
 ]
 
-for x1_init, x2_init, color in initial_conditions:
-    t_ic, x1_ic, x2_ic = resolver_sistema(alpha, beta, gamma, delta, x1_init, x2_init, t_max)
+resultados_ic = [
+    resolver_sistema(alpha, beta, gamma, delta, x1_init, x2_init, t_max)
+    for x1_init, x2_init, _ in initial_conditions
+]
+
+for (x1_init, x2_init, color), (t_ic, x1_ic, x2_ic) in zip(initial_conditions, resultados_ic):
     ax1.plot(t_ic, x1_ic, color=color, linewidth=2, alpha=0.7,
              label=f'x₁(0)={x1_init:.1f}, x₂(0)={x2_init:.1f}')
     ax1.plot(t_ic, x2_ic, color=color, linewidth=2, linestyle='--', alpha=0.7)
@@ -430,13 +581,20 @@ ax1.set_title('Evolução Temporal', fontsize=14, fontweight='bold')
 ax1.legend(fontsize=10)
 ax1.grid(True, alpha=0.3)
 
+x1_grade, x2_grade = np.meshgrid(np.geomspace(5e-3, 5.0, 400), np.geomspace(0.2, 12.0, 400))
+H_grade = calcular_invariante(alpha, beta, gamma, delta, x1_grade, x2_grade)
+
+ax2.contour(x1_grade, x2_grade, H_grade, levels=15, colors='gray', linewidths=0.5, alpha=0.4)
+
 for x1_init, x2_init, color in initial_conditions:
-    t_ic, x1_ic, x2_ic = resolver_sistema(alpha, beta, gamma, delta, x1_init, x2_init, t_max)
     label = f'({x1_init:.1f}, {x2_init:.1f})'
     if x1_init == x1_eq:
         label = 'Equilíbrio'
-    ax2.plot(x1_ic, x2_ic, color=color, linewidth=2.5, alpha=0.7, label=label)
-    ax2.plot(x1_init, x2_init, 'o', color=color, markersize=10)
+    else:
+        H_init = calcular_invariante(alpha, beta, gamma, delta, x1_init, x2_init)
+        ax2.contour(x1_grade, x2_grade, H_grade, levels=[H_init],
+                    colors=color, linewidths=2.5, alpha=0.7)
+    ax2.plot(x1_init, x2_init, 'o', color=color, markersize=10, label=label)
 
 ax2.plot(x1_eq, x2_eq, 'r*', markersize=20, label='Ponto de Equilíbrio', zorder=10)
 ax2.set_xlabel('População de Presas (x₁)', fontsize=13, fontweight='bold')
@@ -453,7 +611,10 @@ plt.show()
 # ### Observação Importante
 #
 # - Cada condição inicial gera uma órbita diferente
-# - Todas as órbitas são fechadas (ciclos periódicos)
+# - Todas as órbitas são fechadas (ciclos periódicos): no diagrama de fase elas
+#   são as curvas de nível da quantidade conservada
+#   $H(x_1, x_2) = \delta x_1 - \gamma \ln x_1 + \beta x_2 - \alpha \ln x_2$,
+#   traçadas diretamente a partir de $H$, sem integração numérica
 # - As órbitas não convergem para o ponto de equilíbrio
 # - O sistema é estruturalmente instável (centro não hiperbólico)
 
@@ -463,15 +624,18 @@ plt.show()
 # Simulação do efeito de eliminar 30% dos predadores em um momento específico.
 
 # %%
-t1_hunt, x1_hunt1, x2_hunt1 = resolver_sistema(alpha, beta, gamma, delta, x1_0, x2_0, t_max=5.0)
-
-x1_hunt_restart: float = x1_hunt1[-1]
-x2_hunt_restart: float = x2_hunt1[-1] * 0.7
+t_caca: float = 5.0
 
-t2_hunt, x1_hunt2, x2_hunt2 = resolver_sistema(
-    alpha, beta, gamma, delta, x1_hunt_restart, x2_hunt_restart, t_max=15.0
+t_hunt, x1_hunt, x2_hunt = resolver_sistema_com_caca(
+    alpha, beta, gamma, delta, x1_0, x2_0, t_caca, 0.7, t_max=20.0
 )
-t2_hunt = t2_hunt + 5.0
+
+i_caca: int = np.searchsorted(t_hunt, t_caca, side='right') - 1
+t1_hunt, x1_hunt1, x2_hunt1 = t_hunt[:i_caca], x1_hunt[:i_caca], x2_hunt[:i_caca]
+t2_hunt, x1_hunt2, x2_hunt2 = t_hunt[i_caca:], x1_hunt[i_caca:], x2_hunt[i_caca:]
+
+x1_hunt_restart: float = x1_hunt2[0]
+x2_hunt_restart: float = x2_hunt2[0]
 
 t_ref, x1_ref, x2_ref = resolver_sistema(alpha, beta, gamma, delta, x1_0, x2_0, t_max=20.0)
 
@@ -483,7 +647,7 @@ ax1.plot(t1_hunt, x1_hunt1, 'b-', linewidth=2.5, label='Presas (com caça)')
 ax1.plot(t1_hunt, x2_hunt1, 'r-', linewidth=2.5, label='Predadores (com caça)')
 ax1.plot(t2_hunt, x1_hunt2, 'b-', linewidth=2.5)
 ax1.plot(t2_hunt, x2_hunt2, 'r-', linewidth=2.5)
-ax1.axvline(x=5, color='black', linestyle='--', linewidth=2, label='Caça (t=5)')
+ax1.axvline(x=t_caca, color='black', linestyle='--', linewidth=2, label='Caça (t=5)')
 
 ax1.set_xlabel('Tempo (t)', fontsize=13, fontweight='bold')
 ax1.set_ylabel('População', fontsize=13, fontweight='bold')
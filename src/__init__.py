@@ -1,6 +1,20 @@
 """Sistemas e Sinais - USP."""
 
-from src.lotka_volterra import calcular_equilibrio, lotka_volterra, resolver_sistema
+from src.lotka_volterra import (
+    calcular_equilibrio,
+    calcular_invariante,
+    lotka_volterra,
+    resolver_sistema,
+    resolver_sistema_com_caca,
+    resolver_sistema_lote,
+)
 
 __version__ = "0.1.0"
-__all__ = ["lotka_volterra", "resolver_sistema", "calcular_equilibrio"]
+__all__ = [
+    "lotka_volterra",
+    "resolver_sistema",
+    "resolver_sistema_com_caca",
+    "resolver_sistema_lote",
+    "calcular_equilibrio",
+    "calcular_invariante",
+]
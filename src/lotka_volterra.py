@@ -5,14 +5,26 @@ Este módulo fornece funções para simular e analisar o sistema de equações
 diferenciais do modelo Lotka-Volterra.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+
 import numpy as np
-from numpy.typing import NDArray
-from scipy.integrate import solve_ivp
+from numba import cfunc, njit
+from numpy.typing import ArrayLike, NDArray
+from scipy.integrate import odeint
+
+# Tolerâncias do LSODA (odeint) usadas por todas as funções de integração.
+_RTOL = 1e-8
+_ATOL = 1e-10
+
+# Os kernels Numba não usam ``cache=True``: o cache em disco fica preso ao
+# nome do módulo em que foi gravado (``src.lotka_volterra`` nos testes,
+# ``lotka_volterra`` na documentação), e carregá-lo sob o outro nome falha.
 
 
 def lotka_volterra(
     t: float, y: list[float], alpha: float, beta: float, gamma: float, delta: float
-) -> list[float]:
+) -> NDArray[np.float64]:
     """
     Sistema de equações diferenciais do modelo Lotka-Volterra.
 
@@ -34,15 +46,224 @@ def lotka_volterra(
 
     Returns
     -------
-    List[float]
+    NDArray
         Derivadas [dx1/dt, dx2/dt]
     """
     x1, x2 = y
     dx1_dt = alpha * x1 - beta * x1 * x2
     dx2_dt = -gamma * x2 + delta * x1 * x2
-    return [dx1_dt, dx2_dt]
+    return np.array((dx1_dt, dx2_dt))
+
+
+@njit(fastmath=True)
+def _lv_tuple(
+    t: float,
+    x1: float,
+    x2: float,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    delta: float,
+) -> tuple[float, float]:
+    """
+    Derivadas do sistema para um estado escalar (x1, x2).
+
+    Núcleo comum aos integradores compilados: recebe e devolve escalares,
+    sem indexação de arrays, para que o Numba mantenha o estado em
+    registradores dentro dos laços.
+    """
+    return alpha * x1 - beta * x1 * x2, -gamma * x2 + delta * x1 * x2
+
+
+@njit(fastmath=True)
+def _lv_rhs(
+    t: float,
+    y: NDArray[np.float64],
+    alpha: float,
+    beta: float,
+    gamma: float,
+    delta: float,
+) -> NDArray[np.float64]:
+    """
+    Versão compilada (Numba) de :func:`lotka_volterra` usada pelo integrador.
+
+    Recebe os mesmos argumentos, mas devolve as derivadas em um ``ndarray``
+    de 2 elementos, evitando o overhead do interpretador a cada passo.
+    """
+    out = np.empty(2)
+    out[0], out[1] = _lv_tuple(t, y[0], y[1], alpha, beta, gamma, delta)
+    return out
 
 
+@njit(fastmath=True)
+def _lv_jac(
+    t: float,
+    y: NDArray[np.float64],
+    alpha: float,
+    beta: float,
+    gamma: float,
+    delta: float,
+) -> NDArray[np.float64]:
+    """
+    Matriz Jacobiana analítica do sistema Lotka-Volterra.
+
+    Fornecida ao integrador para evitar a estimativa por diferenças finitas,
+    que custaria avaliações extras de :func:`_lv_rhs` a cada atualização.
+    """
+    jac = np.empty((2, 2))
+    jac[0, 0] = alpha - beta * y[1]
+    jac[0, 1] = -beta * y[0]
+    jac[1, 0] = delta * y[1]
+    jac[1, 1] = -gamma + delta * y[0]
+    return jac
+
+
+@njit(fastmath=True)
+def _lv_rhs_lote(
+    t: float, y: NDArray[np.float64], params: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Sistema Lotka-Volterra para N conjuntos de parâmetros integrados juntos.
+
+    O estado ``y`` tem tamanho 2N: as N populações de presas seguidas das N
+    populações de predadores. ``params`` tem forma (N, 4) com as colunas
+    (alpha, beta, gamma, delta).
+    """
+    n = params.shape[0]
+    out = np.empty(2 * n)
+    for i in range(n):
+        x1 = y[i]
+        x2 = y[n + i]
+        out[i] = params[i, 0] * x1 - params[i, 1] * x1 * x2
+        out[n + i] = -params[i, 2] * x2 + params[i, 3] * x1 * x2
+    return out
+
+
+@njit(fastmath=True)
+def _rk4_lv(
+    alpha: float,
+    beta: float,
+    gamma: float,
+    delta: float,
+    x1_0: float,
+    x2_0: float,
+    t_max: float,
+    n_points: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Integra o sistema com Runge-Kutta de 4ª ordem de passo fixo.
+
+    Um passo de tamanho ``t_max / (n_points - 1)`` por intervalo da malha de
+    saída. O estado (a, b) passa de um passo ao outro em escalares e os
+    estágios são calculados por :func:`_lv_tuple`, sem alocar arrays nem
+    reler a saída dentro do laço.
+    """
+    p = (alpha, beta, gamma, delta)
+    t = np.linspace(0.0, t_max, n_points)
+    x1 = np.empty(n_points)
+    x2 = np.empty(n_points)
+    a = x1[0] = x1_0
+    b = x2[0] = x2_0
+    dt = t_max / (n_points - 1) if n_points > 1 else 0.0
+    for i in range(n_points - 1):
+        ti = t[i]
+        k1a, k1b = _lv_tuple(ti, a, b, *p)
+        k2a, k2b = _lv_tuple(ti + 0.5 * dt, a + 0.5 * dt * k1a, b + 0.5 * dt * k1b, *p)
+        k3a, k3b = _lv_tuple(ti + 0.5 * dt, a + 0.5 * dt * k2a, b + 0.5 * dt * k2b, *p)
+        k4a, k4b = _lv_tuple(ti + dt, a + dt * k3a, b + dt * k3b, *p)
+        a += dt / 6.0 * (k1a + 2.0 * k2a + 2.0 * k3a + k4a)
+        b += dt / 6.0 * (k1b + 2.0 * k2b + 2.0 * k3b + k4b)
+        x1[i + 1] = a
+        x2[i + 1] = b
+    return t, x1, x2
+
+
+@njit(fastmath=True)
+def _rk4_lv_lote(
+    params: NDArray[np.float64],
+    y0: NDArray[np.float64],
+    t_max: float,
+    n_points: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    RK4 de passo fixo para N sistemas avançados juntos.
+
+    Mesmo esquema de :func:`_rk4_lv`, com o laço interno percorrendo os N
+    sistemas em arrays contíguos (parâmetros e estado em colunas separadas)
+    para que o LLVM vetorize os estágios. Devolve x1, x2 de forma
+    (n_points, N).
+    """
+    n = params.shape[0]
+    alpha = params[:, 0].copy()
+    beta = params[:, 1].copy()
+    gamma = params[:, 2].copy()
+    delta = params[:, 3].copy()
+    x1 = np.empty((n_points, n))
+    x2 = np.empty((n_points, n))
+    x1[0] = y0[:, 0]
+    x2[0] = y0[:, 1]
+    dt = t_max / (n_points - 1) if n_points > 1 else 0.0
+    for j in range(n_points - 1):
+        for i in range(n):
+            p = (alpha[i], beta[i], gamma[i], delta[i])
+            a = x1[j, i]
+            b = x2[j, i]
+            k1a, k1b = _lv_tuple(0.0, a, b, *p)
+            k2a, k2b = _lv_tuple(0.0, a + 0.5 * dt * k1a, b + 0.5 * dt * k1b, *p)
+            k3a, k3b = _lv_tuple(0.0, a + 0.5 * dt * k2a, b + 0.5 * dt * k2b, *p)
+            k4a, k4b = _lv_tuple(0.0, a + dt * k3a, b + dt * k3b, *p)
+            x1[j + 1, i] = a + dt / 6.0 * (k1a + 2.0 * k2a + 2.0 * k3a + k4a)
+            x2[j + 1, i] = b + dt / 6.0 * (k1b + 2.0 * k2b + 2.0 * k3b + k4b)
+    return x1, x2
+
+
+@lru_cache(maxsize=16)
+def _t_grid(t_max: float, n_points: int) -> NDArray[np.float64]:
+    """
+    Malha de tempos ``np.linspace(0, t_max, n_points)`` compartilhada.
+
+    Chamadas com o mesmo (t_max, n_points) recebem o mesmo array, marcado
+    como somente-leitura.
+    """
+    t = np.linspace(0.0, t_max, n_points)
+    t.setflags(write=False)
+    return t
+
+
+@lru_cache(maxsize=1)
+def _numbalsoda_lv() -> Callable[..., tuple[NDArray[np.float64], bool]]:
+    """
+    Integrador LSODA do ``numbalsoda`` para o sistema, construído sob demanda.
+
+    Importar o ``numbalsoda`` leva alguns segundos, então o pacote só é
+    carregado (e o RHS ``cfunc`` compilado) na primeira chamada com
+    ``method="numbalsoda"``. Como os kernels ``@njit``, o ``cfunc`` não usa o
+    cache em disco do Numba.
+    """
+    from numbalsoda import lsoda, lsoda_sig
+
+    @cfunc(lsoda_sig)
+    def rhs(
+        t: float,
+        y: NDArray[np.float64],
+        dy: NDArray[np.float64],
+        params: NDArray[np.float64],
+    ) -> None:  # pragma: no cover
+        dy[0], dy[1] = _lv_tuple(
+            t, y[0], y[1], params[0], params[1], params[2], params[3]
+        )
+
+    def integrar(
+        y0: NDArray[np.float64],
+        t_eval: NDArray[np.float64],
+        params: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], bool]:
+        return lsoda(rhs.address, y0, t_eval, data=params, rtol=_RTOL, atol=_ATOL)
+
+    return integrar
+
+
+@lru_cache(maxsize=64)
 def resolver_sistema(
     alpha: float,
     beta: float,
@@ -52,9 +273,19 @@ def resolver_sistema(
     x2_0: float,
     t_max: float = 50.0,
     n_points: int = 1000,
+    method: str = "LSODA",
 ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
     """
-    Resolve o sistema de EDOs numericamente usando o método de Runge-Kutta.
+    Resolve o sistema de EDOs numericamente.
+
+    Por padrão usa o método adaptativo LSODA (ODEPACK, via ``odeint``). Com
+    ``method="rk4"`` usa um Runge-Kutta de 4ª ordem compilado com passo fixo
+    igual ao espaçamento da malha de saída, mais rápido porém com precisão
+    dependente de ``n_points``.
+
+    Os resultados são memorizados por argumentos (até 64 combinações), e os
+    arrays retornados são somente-leitura por serem compartilhados entre
+    chamadas; use ``.copy()`` antes de modificá-los.
 
     Parameters
     ----------
@@ -74,36 +305,308 @@ def resolver_sistema(
         Tempo final de simulação (padrão: 50.0)
     n_points : int, optional
         Número de pontos para avaliação (padrão: 1000)
+    method : str, optional
+        Integrador: ``"LSODA"`` (``odeint``), ``"numbalsoda"`` (o mesmo
+        LSODA com o laço em C; requer o extra ``fast``) ou ``"rk4"``
+        (padrão: ``"LSODA"``)
 
     Returns
     -------
     Tuple[NDArray, NDArray, NDArray]
         Tupla contendo (t, x1, x2) onde t é o vetor de tempos,
         x1 é a população de presas e x2 é a população de predadores
+
+    Raises
+    ------
+    ValueError
+        Se ``method`` não for um dos integradores suportados ou se
+        ``n_points`` for menor que 1
     """
-    y0 = [x1_0, x2_0]
-    t_span = (0.0, t_max)
-    t_eval = np.linspace(0.0, t_max, n_points)
-
-    sol = solve_ivp(
-        lotka_volterra,
-        t_span,
-        y0,
-        args=(alpha, beta, gamma, delta),
-        t_eval=t_eval,
-        method="RK45",
-        dense_output=True,
+    if method not in ("LSODA", "numbalsoda", "rk4"):
+        raise ValueError(f"Método desconhecido: {method!r}")
+    if n_points < 1:
+        raise ValueError(f"n_points deve ser pelo menos 1, recebido {n_points}")
+
+    if x1_0 == 0.0 or x2_0 == 0.0:
+        # Sem presas (ou sem predadores) o sistema desacopla em decaimento
+        # (ou crescimento) exponencial, com solução exata.
+        t_eval = _t_grid(t_max, n_points)
+        x1 = np.zeros(n_points) if x1_0 == 0.0 else x1_0 * np.exp(alpha * t_eval)
+        x2 = np.zeros(n_points) if x2_0 == 0.0 else x2_0 * np.exp(-gamma * t_eval)
+    elif method == "rk4":
+        t_eval, x1, x2 = _rk4_lv(alpha, beta, gamma, delta, x1_0, x2_0, t_max, n_points)
+    else:
+        y0 = [x1_0, x2_0]
+        t_eval = _t_grid(t_max, n_points)
+
+        sucesso = False
+        if method == "numbalsoda":
+            # Laço de integração inteiramente em C; em caso de falha, repete
+            # com o odeint para manter o mesmo comportamento (e avisos).
+            sol, sucesso = _numbalsoda_lv()(
+                np.array(y0, dtype=np.float64),
+                t_eval,
+                np.array([alpha, beta, gamma, delta], dtype=np.float64),
+            )
+        if not sucesso:
+            sol = odeint(
+                _lv_rhs,
+                y0,
+                t_eval,
+                args=(alpha, beta, gamma, delta),
+                Dfun=_lv_jac,
+                tfirst=True,
+                rtol=_RTOL,
+                atol=_ATOL,
+            )
+        x1, x2 = sol[:, 0], sol[:, 1]
+
+    for arr in (t_eval, x1, x2):
+        arr.setflags(write=False)
+    return t_eval, x1, x2
+
+
+@lru_cache(maxsize=64)
+def resolver_sistema_com_caca(
+    alpha: float,
+    beta: float,
+    gamma: float,
+    delta: float,
+    x1_0: float,
+    x2_0: float,
+    t_caca: float,
+    fator_x2: float,
+    t_max: float = 50.0,
+    n_points: int = 1000,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Resolve o sistema com uma redução instantânea dos predadores em ``t_caca``.
+
+    A integração é interrompida em ``t_caca``, a população de predadores é
+    multiplicada por ``fator_x2`` e a integração recomeça a partir desse
+    estado. Os dois trechos usam o mesmo RHS compilado.
+
+    Parameters
+    ----------
+    alpha : float
+        Taxa de crescimento das presas
+    beta : float
+        Taxa de predação
+    gamma : float
+        Taxa de mortalidade dos predadores
+    delta : float
+        Eficiência de conversão
+    x1_0 : float
+        População inicial de presas
+    x2_0 : float
+        População inicial de predadores
+    t_caca : float
+        Instante da caça, estritamente entre 0 e ``t_max``
+    fator_x2 : float
+        Fator aplicado a x2 em ``t_caca`` (0.7 remove 30% dos predadores)
+    t_max : float, optional
+        Tempo final de simulação (padrão: 50.0)
+    n_points : int, optional
+        Número de pontos da malha de avaliação (padrão: 1000)
+
+    Returns
+    -------
+    Tuple[NDArray, NDArray, NDArray]
+        Tupla (t, x1, x2) com os pontos da malha mais ``t_caca`` repetido:
+        a primeira ocorrência tem o estado antes da caça e a segunda, o
+        estado depois dela. Os arrays são somente-leitura.
+
+    Raises
+    ------
+    ValueError
+        Se ``t_caca`` não estiver no intervalo aberto (0, t_max)
+    """
+    if not 0.0 < t_caca < t_max:
+        raise ValueError("t_caca deve estar entre 0 e t_max")
+
+    t_grade = _t_grid(t_max, n_points)
+    t_antes = np.append(t_grade[t_grade < t_caca], t_caca)
+    t_depois = np.insert(t_grade[t_grade > t_caca], 0, t_caca)
+    args = (alpha, beta, gamma, delta)
+
+    opcoes = {"Dfun": _lv_jac, "tfirst": True, "rtol": _RTOL, "atol": _ATOL}
+
+    sol_antes = odeint(_lv_rhs, [x1_0, x2_0], t_antes, args=args, **opcoes)
+    y_caca = [sol_antes[-1, 0], sol_antes[-1, 1] * fator_x2]
+    sol_depois = odeint(_lv_rhs, y_caca, t_depois, args=args, **opcoes)
+
+    t_eval = np.concatenate((t_antes, t_depois))
+    sol = np.concatenate((sol_antes, sol_depois))
+    x1, x2 = sol[:, 0], sol[:, 1]
+    for arr in (t_eval, x1, x2):
+        arr.setflags(write=False)
+    return t_eval, x1, x2
+
+
+@lru_cache(maxsize=1)
+def _diffrax_lote() -> Callable[[ArrayLike, ArrayLike, ArrayLike], ArrayLike]:
+    """
+    Integrador em lote do ``diffrax`` (Tsit5 adaptativo), compilado pelo JAX.
+
+    Cada sistema é resolvido com seu próprio controle de passo via
+    ``jax.vmap``; o JAX usa a GPU quando disponível e a CPU caso contrário.
+    Importado e construído só na primeira chamada, para que o ``jax`` não
+    pese na importação deste módulo. As funções recebem e devolvem arrays
+    do JAX, daí as anotações genéricas ``ArrayLike``.
+    """
+    import diffrax
+    import jax
+    import jax.numpy as jnp
+
+    def campo(t: float, y: ArrayLike, p: ArrayLike) -> ArrayLike:
+        x1, x2 = y[0], y[1]
+        return jnp.stack((p[0] * x1 - p[1] * x1 * x2, -p[2] * x2 + p[3] * x1 * x2))
+
+    termo = diffrax.ODETerm(campo)
+    solver = diffrax.Tsit5()
+    controle = diffrax.PIDController(rtol=_RTOL, atol=_ATOL)
+
+    def resolver(p: ArrayLike, y0: ArrayLike, t_eval: ArrayLike) -> ArrayLike:
+        sol = diffrax.diffeqsolve(
+            termo,
+            solver,
+            t_eval[0],
+            t_eval[-1],
+            None,
+            y0,
+            args=p,
+            saveat=diffrax.SaveAt(ts=t_eval),
+            stepsize_controller=controle,
+            max_steps=None,
+        )
+        return sol.ys
+
+    return jax.jit(jax.vmap(resolver, in_axes=(0, 0, None)))
+
+
+def resolver_sistema_lote(
+    params: ArrayLike,
+    y0: ArrayLike,
+    t_max: float = 50.0,
+    n_points: int = 1000,
+    method: str = "LSODA",
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Resolve vários sistemas independentes em uma única chamada ao integrador.
+
+    Os N sistemas são empilhados em um único vetor de estado de tamanho 2N,
+    de modo que o custo de preparação do integrador é pago uma só vez.
+
+    Parameters
+    ----------
+    params : ArrayLike
+        Array de forma (N, 4) com as linhas (alpha, beta, gamma, delta)
+    y0 : ArrayLike
+        Condições iniciais (x1_0, x2_0), de forma (2,) para todos os
+        sistemas ou (N, 2) para uma condição por sistema
+    t_max : float, optional
+        Tempo final de simulação (padrão: 50.0)
+    n_points : int, optional
+        Número de pontos para avaliação (padrão: 1000)
+    method : str, optional
+        Integrador: ``"LSODA"``, ``"rk4"`` ou ``"diffrax"`` (padrão:
+        ``"LSODA"``). ``"diffrax"`` requer o extra ``jax`` e roda na GPU
+        quando o JAX encontra uma (``jax[cuda12]``); compensa para lotes
+        grandes
+
+    Returns
+    -------
+    Tuple[NDArray, NDArray, NDArray]
+        Tupla contendo (t, x1, x2) onde t é o vetor de tempos e x1, x2
+        têm forma (N, n_points), uma linha por conjunto de parâmetros; t é
+        compartilhado entre chamadas e somente-leitura
+
+    Raises
+    ------
+    ValueError
+        Se ``method`` não for um dos integradores suportados ou se
+        ``n_points`` for menor que 1
+    """
+    if n_points < 1:
+        raise ValueError(f"n_points deve ser pelo menos 1, recebido {n_points}")
+
+    params = np.atleast_2d(np.asarray(params, dtype=np.float64))
+    n = params.shape[0]
+    y0 = np.broadcast_to(np.asarray(y0, dtype=np.float64), (n, 2))
+    t_eval = _t_grid(t_max, n_points)
+
+    if method == "rk4":
+        x1, x2 = _rk4_lv_lote(params, np.ascontiguousarray(y0), t_max, n_points)
+        return t_eval, x1.T, x2.T
+    if method == "diffrax":
+        import jax
+
+        with jax.enable_x64(True):
+            ys = np.asarray(_diffrax_lote()(params, np.asarray(y0), t_eval))
+        return t_eval, ys[..., 0], ys[..., 1]
+    if method != "LSODA":
+        raise ValueError(f"Método desconhecido: {method!r}")
+
+    sol = odeint(
+        _lv_rhs_lote,
+        np.concatenate((y0[:, 0], y0[:, 1])),
+        t_eval,
+        args=(params,),
+        tfirst=True,
+        rtol=_RTOL,
+        atol=_ATOL,
     )
 
-    return sol.t, sol.y[0], sol.y[1]
+    return t_eval, sol[:, :n].T, sol[:, n:].T
 
 
 def calcular_equilibrio(
-    alpha: float, beta: float, gamma: float, delta: float
-) -> tuple[float, float]:
+    alpha: ArrayLike, beta: ArrayLike, gamma: ArrayLike, delta: ArrayLike
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """
     Calcula o ponto de equilíbrio não-trivial do sistema.
 
+    Aceita escalares ou arrays de parâmetros (com broadcasting), o que
+    permite calcular os equilíbrios de uma varredura inteira em uma chamada.
+
+    Parameters
+    ----------
+    alpha : ArrayLike
+        Taxa de crescimento das presas
+    beta : ArrayLike
+        Taxa de predação
+    gamma : ArrayLike
+        Taxa de mortalidade dos predadores
+    delta : ArrayLike
+        Eficiência de conversão
+
+    Returns
+    -------
+    Tuple[NDArray, NDArray]
+        Tupla (x1_eq, x2_eq) com as populações de equilíbrio; escalares
+        para parâmetros escalares
+    """
+    x1_eq = np.asarray(gamma) / np.asarray(delta)
+    x2_eq = np.asarray(alpha) / np.asarray(beta)
+    return x1_eq, x2_eq
+
+
+def calcular_invariante(
+    alpha: float,
+    beta: float,
+    gamma: float,
+    delta: float,
+    x1: ArrayLike,
+    x2: ArrayLike,
+) -> NDArray[np.float64]:
+    """
+    Calcula a quantidade conservada H do sistema.
+
+    H(x1, x2) = delta*x1 - gamma*ln(x1) + beta*x2 - alpha*ln(x2) é constante
+    ao longo de cada trajetória, então as órbitas são as curvas de nível de H
+    e podem ser traçadas sem integração numérica. O mínimo de H ocorre no
+    ponto de equilíbrio.
+
     Parameters
     ----------
     alpha : float
@@ -114,12 +617,16 @@ def calcular_equilibrio(
         Taxa de mortalidade dos predadores
     delta : float
         Eficiência de conversão
+    x1 : ArrayLike
+        População(ões) de presas, estritamente positiva(s)
+    x2 : ArrayLike
+        População(ões) de predadores, estritamente positiva(s)
 
     Returns
     -------
-    Tuple[float, float]
-        Tupla (x1_eq, x2_eq) com as populações de equilíbrio
+    NDArray
+        Valor de H em cada ponto, com o formato de ``x1`` e ``x2`` combinados
     """
-    x1_eq = gamma / delta
-    x2_eq = alpha / beta
-    return x1_eq, x2_eq
+    x1 = np.asarray(x1, dtype=np.float64)
+    x2 = np.asarray(x2, dtype=np.float64)
+    return delta * x1 - gamma * np.log(x1) + beta * x2 - alpha * np.log(x2)
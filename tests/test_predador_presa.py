@@ -1,22 +1,52 @@
+import subprocess
 import sys
 from pathlib import Path
 
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
+from scipy.integrate import solve_ivp
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from src.lotka_volterra import calcular_equilibrio, lotka_volterra, resolver_sistema
+from src.lotka_volterra import (
+    _lv_jac,
+    _lv_rhs,
+    _lv_rhs_lote,
+    _lv_tuple,
+    _rk4_lv,
+    _rk4_lv_lote,
+    _t_grid,
+    calcular_equilibrio,
+    calcular_invariante,
+    lotka_volterra,
+    resolver_sistema,
+    resolver_sistema_com_caca,
+    resolver_sistema_lote,
+)
+
+PARAMS_PADRAO = (6.0, 2.0, 2.0, 3.0, 1.0, 1.0)
+
+
+@pytest.fixture(scope="session")
+def solucao_longa():
+    """Solução de referência (t_max=50, 5000 pontos), integrada uma única vez."""
+    return resolver_sistema(*PARAMS_PADRAO, t_max=50.0, n_points=5000)
+
+
+@pytest.fixture(scope="session")
+def solucao_padrao(solucao_longa):
+    """Primeiros 2000 pontos (t < 20) de :func:`solucao_longa`, sem cópia."""
+    return tuple(arr[:2000] for arr in solucao_longa)
 
 
 class TestLotkaVolterra:
 
-    def test_retorna_lista_com_dois_elementos(self):
-        """Testa se a função retorna uma lista com 2 elementos."""
+    def test_retorna_array_com_dois_elementos(self):
+        """Testa se a função retorna um ndarray com 2 elementos."""
         result = lotka_volterra(0.0, [1.0, 1.0], 1.0, 1.0, 1.0, 1.0)
-        assert isinstance(result, list)
-        assert len(result) == 2
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (2,)
 
     def test_derivada_presas_sem_predadores(self):
         """Testa crescimento exponencial de presas sem predadores."""
@@ -47,6 +77,46 @@ class TestLotkaVolterra:
         assert all(np.isfinite(result))
 
 
+class TestLvRhs:
+    """Testes para a versão compilada do sistema de EDOs."""
+
+    def test_retorna_array_com_dois_elementos(self):
+        """Testa se a função retorna um ndarray com 2 elementos."""
+        result = _lv_rhs(0.0, np.array([1.0, 1.0]), 1.0, 1.0, 1.0, 1.0)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (2,)
+
+    @pytest.mark.parametrize("rhs", [_lv_rhs, _lv_rhs.py_func])
+    def test_equivale_a_lotka_volterra(self, rhs):
+        """Testa se as versões compilada e Python coincidem com lotka_volterra."""
+        y = [2.5, 1.5]
+        params = (6.0, 2.0, 2.0, 3.0)
+        assert_allclose(rhs(0.0, np.array(y), *params), lotka_volterra(0.0, y, *params))
+
+    @pytest.mark.parametrize("rhs", [_lv_tuple, _lv_tuple.py_func])
+    def test_versao_escalar_equivale_a_lotka_volterra(self, rhs):
+        """Testa se a versão escalar (tupla) coincide com lotka_volterra."""
+        params = (6.0, 2.0, 2.0, 3.0)
+        result = rhs(0.0, 2.5, 1.5, *params)
+        assert isinstance(result, tuple)
+        assert_allclose(result, lotka_volterra(0.0, [2.5, 1.5], *params))
+
+    @pytest.mark.parametrize("jac", [_lv_jac, _lv_jac.py_func])
+    def test_jacobiano_analitico(self, jac):
+        """Testa o Jacobiano analítico contra diferenças finitas centradas."""
+        y = np.array([2.5, 1.5])
+        params = (6.0, 2.0, 2.0, 3.0)
+        h = 1e-6
+        numerico = np.empty((2, 2))
+        for j in range(2):
+            dy = np.zeros(2)
+            dy[j] = h
+            numerico[:, j] = (
+                _lv_rhs(0.0, y + dy, *params) - _lv_rhs(0.0, y - dy, *params)
+            ) / (2 * h)
+        assert_allclose(jac(0.0, y, *params), numerico, rtol=1e-6)
+
+
 class TestCalcularEquilibrio:
     """Testes para a função calcular_equilibrio."""
 
@@ -87,6 +157,45 @@ class TestCalcularEquilibrio:
             assert_allclose(x1_eq, gamma / delta)
             assert_allclose(x2_eq, alpha / beta)
 
+    def test_parametros_em_array(self):
+        """Testa o cálculo vetorizado para vários conjuntos de parâmetros."""
+        params = np.array(
+            [
+                (1.0, 1.0, 1.0, 1.0),
+                (10.0, 2.0, 3.0, 4.0),
+                (0.5, 0.1, 0.2, 0.3),
+            ]
+        )
+        x1_eq, x2_eq = calcular_equilibrio(*params.T)
+        assert x1_eq.shape == (3,)
+        assert_allclose(x1_eq, params[:, 2] / params[:, 3])
+        assert_allclose(x2_eq, params[:, 0] / params[:, 1])
+
+    def test_broadcast_de_listas_e_escalares(self):
+        """Testa a mistura de listas e escalares nos parâmetros."""
+        x1_eq, x2_eq = calcular_equilibrio([3.0, 6.0], 2.0, 2.0, 3.0)
+        assert_allclose(x1_eq, [2.0 / 3.0, 2.0 / 3.0])
+        assert_allclose(x2_eq, [1.5, 3.0])
+
+
+class TestCalcularInvariante:
+    """Testes para a função calcular_invariante."""
+
+    def test_constante_ao_longo_da_trajetoria(self):
+        """Testa se H se conserva ao longo de uma solução numérica."""
+        params = (6.0, 2.0, 2.0, 3.0)
+        t, x1, x2 = resolver_sistema(*params, 1.0, 1.0, t_max=20.0, n_points=500)
+        h = calcular_invariante(*params, x1, x2)
+        assert_allclose(h, h[0], rtol=1e-6)
+
+    def test_minimo_no_equilibrio(self):
+        """Testa se H atinge o mínimo no ponto de equilíbrio."""
+        params = (6.0, 2.0, 2.0, 3.0)
+        x1_eq, x2_eq = calcular_equilibrio(*params)
+        x1, x2 = np.meshgrid(np.linspace(0.1, 3.0, 50), np.linspace(0.1, 6.0, 50))
+        h_eq = calcular_invariante(*params, x1_eq, x2_eq)
+        assert np.all(calcular_invariante(*params, x1, x2) >= h_eq)
+
 
 class TestResolverSistema:
     """Testes para a função resolver_sistema."""
@@ -127,24 +236,22 @@ class TestResolverSistema:
         assert_allclose(x1[0], x1_0, rtol=1e-5)
         assert_allclose(x2[0], x2_0, rtol=1e-5)
 
-    def test_populacoes_nao_negativas(self):
+    def test_populacoes_nao_negativas(self, solucao_padrao):
         """Testa se as populações permanecem não-negativas."""
-        t, x1, x2 = resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=15.0)
+        t, x1, x2 = solucao_padrao
         assert np.all(x1 >= 0), "População de presas ficou negativa"
         assert np.all(x2 >= 0), "População de predadores ficou negativa"
 
-    def test_sem_valores_nan_ou_inf(self):
+    def test_sem_valores_nan_ou_inf(self, solucao_padrao):
         """Testa se não há valores NaN ou Inf na solução."""
-        t, x1, x2 = resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=15.0)
+        t, x1, x2 = solucao_padrao
         assert np.all(np.isfinite(t))
         assert np.all(np.isfinite(x1))
         assert np.all(np.isfinite(x2))
 
-    def test_oscilacao_periodica(self):
+    def test_oscilacao_periodica(self, solucao_padrao):
         """Testa se há comportamento oscilatório."""
-        t, x1, x2 = resolver_sistema(
-            6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=20.0, n_points=2000
-        )
+        t, x1, x2 = solucao_padrao
 
         x1_max = np.max(x1)
         x1_min = np.min(x1)
@@ -154,14 +261,15 @@ class TestResolverSistema:
             x1_min < x1[0]
         ), "População de presas deve oscilar abaixo do valor inicial"
 
-    def test_defasagem_temporal(self):
+    def test_defasagem_temporal(self, solucao_padrao):
         """Testa se há defasagem entre picos de presas e predadores."""
-        t, x1, x2 = resolver_sistema(
-            6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=20.0, n_points=2000
-        )
+        t, x1, x2 = solucao_padrao
 
-        idx_max_x1 = np.argmax(x1[:1000])
-        idx_max_x2 = np.argmax(x2[:1000])
+        # Primeiro ciclo apenas (período ~2.1): em uma órbita fechada os picos
+        # se repetem com a mesma altura, e argmax sobre vários ciclos seria
+        # decidido por erro numérico.
+        idx_max_x1 = np.argmax(x1[:200])
+        idx_max_x2 = np.argmax(x2[:200])
 
         assert (
             idx_max_x2 > idx_max_x1
@@ -169,26 +277,250 @@ class TestResolverSistema:
 
     def test_parametros_diferentes(self):
         """Testa com diferentes conjuntos de parâmetros."""
-        params_sets = [
-            (3.0, 1.0, 1.0, 1.5),
+        params = np.array(
+            [
+                (3.0, 1.0, 1.0, 1.5),
+                (10.0, 3.0, 4.0, 5.0),
+                (1.0, 0.5, 0.5, 1.0),
+            ]
+        )
+
+        # Uma integração em lote para todos os conjuntos de parâmetros.
+        t, x1, x2 = resolver_sistema_lote(params, (1.0, 1.0), t_max=10.0)
+        assert len(t) > 0
+        assert np.all(np.isfinite(x1))
+        assert np.all(np.isfinite(x2))
+        assert np.all(x1 >= 0)
+        assert np.all(x2 >= 0)
+
+    def test_resultado_memorizado(self):
+        """Testa se chamadas repetidas reutilizam o mesmo resultado."""
+        args = (6.0, 2.0, 2.0, 3.0, 1.0, 1.0)
+        primeiro = resolver_sistema(*args, t_max=10.0, n_points=100)
+        segundo = resolver_sistema(*args, t_max=10.0, n_points=100)
+        assert all(a is b for a, b in zip(primeiro, segundo, strict=True))
+
+    def test_arrays_somente_leitura(self):
+        """Testa se os arrays compartilhados pelo cache não podem ser alterados."""
+        t, x1, x2 = resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=10.0)
+        with pytest.raises(ValueError):
+            x1[0] = 0.0
+
+    def test_malha_de_tempo_compartilhada(self):
+        """Testa se a malha de tempos é reutilizada e somente-leitura."""
+        t = _t_grid(10.0, 100)
+        assert t is _t_grid(10.0, 100)
+        assert not t.flags.writeable
+        assert_allclose(t, np.linspace(0.0, 10.0, 100))
+
+    def test_numbalsoda_coincide_com_odeint(self):
+        """Testa se o LSODA do numbalsoda reproduz o caminho via odeint."""
+        pytest.importorskip("numbalsoda")
+        args = (6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 500)
+        _, x1_c, x2_c = resolver_sistema(*args, method="numbalsoda")
+        _, x1_py, x2_py = resolver_sistema(*args)
+        assert_allclose(x1_c, x1_py, atol=1e-6)
+        assert_allclose(x2_c, x2_py, atol=1e-6)
+
+    def test_numbalsoda_falha_recorre_ao_odeint(self, monkeypatch):
+        """Testa se uma falha do numbalsoda é refeita com o odeint."""
+
+        def falha(y0, t_eval, params):
+            return np.full((len(t_eval), 2), np.nan), False
+
+        # ``src.lotka_volterra`` como atributo é a função reexportada.
+        modulo = sys.modules[resolver_sistema.__module__]
+        monkeypatch.setattr(modulo, "_numbalsoda_lv", lambda: falha)
+        args = (6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 500)
+        _, x1, x2 = resolver_sistema.__wrapped__(*args, method="numbalsoda")
+        _, x1_ref, x2_ref = resolver_sistema(*args)
+        assert_allclose(x1, x1_ref)
+        assert_allclose(x2, x2_ref)
+
+    @pytest.mark.parametrize("rk4", [_rk4_lv, _rk4_lv.py_func])
+    def test_rk4_coincide_com_lsoda(self, rk4):
+        """Testa o RK4 de passo fixo contra uma solução LSODA precisa."""
+        t, x1, x2 = rk4(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 2000)
+        sol = solve_ivp(
+            _lv_rhs,
+            (0.0, 10.0),
+            [1.0, 1.0],
+            args=(6.0, 2.0, 2.0, 3.0),
+            t_eval=t,
+            method="LSODA",
+            rtol=1e-10,
+            atol=1e-12,
+        )
+        assert_allclose(x1, sol.y[0], atol=1e-4)
+        assert_allclose(x2, sol.y[1], atol=1e-4)
+
+    def test_method_rk4(self):
+        """Testa se method="rk4" respeita a malha e as condições iniciais."""
+        t, x1, x2 = resolver_sistema(
+            6.0, 2.0, 2.0, 3.0, 2.5, 1.5, t_max=10.0, n_points=100, method="rk4"
+        )
+        assert len(t) == len(x1) == len(x2) == 100
+        assert_allclose(t[-1], 10.0)
+        assert x1[0] == 2.5
+        assert x2[0] == 1.5
+
+    def test_method_desconhecido(self):
+        """Testa se um método desconhecido gera ValueError."""
+        with pytest.raises(ValueError):
+            resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, method="euler")
+
+    @pytest.mark.parametrize("method", ["LSODA", "rk4"])
+    def test_n_points_invalido(self, method):
+        """Testa se n_points < 1 gera ValueError antes de chamar o integrador."""
+        with pytest.raises(ValueError, match="n_points"):
+            resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 0, method)
+
+
+class TestResolverSistemaComCaca:
+    """Testes para a função resolver_sistema_com_caca."""
+
+    def test_reducao_dos_predadores_em_t_caca(self):
+        """Testa se x2 é multiplicado pelo fator no instante da caça."""
+        t, x1, x2 = resolver_sistema_com_caca(
+            6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 5.0, 0.7, t_max=20.0, n_points=200
+        )
+        i_antes, i_depois = np.flatnonzero(t == 5.0)
+        assert i_depois == i_antes + 1
+        assert_allclose(x1[i_depois], x1[i_antes])
+        assert_allclose(x2[i_depois], 0.7 * x2[i_antes])
+        assert np.all(np.diff(t) >= 0)
+
+    def test_fator_um_equivale_a_resolver_sistema(self):
+        """Testa se sem caça (fator 1) a solução coincide com a contínua."""
+        t, x1, x2 = resolver_sistema_com_caca(
+            6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 5.05, 1.0, t_max=20.0, n_points=200
+        )
+        t_ref, x1_ref, x2_ref = resolver_sistema(
+            6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=20.0, n_points=200
+        )
+        sem_caca = t != 5.05
+        assert_allclose(t[sem_caca], t_ref)
+        assert_allclose(x1[sem_caca], x1_ref, atol=1e-5)
+        assert_allclose(x2[sem_caca], x2_ref, atol=1e-5)
+
+    @pytest.mark.parametrize("t_caca", [0.0, 20.0, 25.0])
+    def test_t_caca_fora_do_intervalo(self, t_caca):
+        """Testa se t_caca fora de (0, t_max) gera ValueError."""
+        with pytest.raises(ValueError):
+            resolver_sistema_com_caca(
+                6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_caca, 0.7, t_max=20.0
+            )
+
+
+class TestResolverSistemaLote:
+    """Testes para a função resolver_sistema_lote."""
+
+    params = np.array(
+        [
+            (6.0, 2.0, 2.0, 3.0),
+            (1.0, 1.0, 1.0, 1.0),
             (10.0, 3.0, 4.0, 5.0),
-            (1.0, 0.5, 0.5, 1.0),
         ]
-
-        for alpha, beta, gamma, delta in params_sets:
-            t, x1, x2 = resolver_sistema(
-                alpha, beta, gamma, delta, 1.0, 1.0, t_max=10.0
+    )
+
+    def test_formato_dos_arrays(self):
+        """Testa se x1 e x2 têm uma linha por conjunto de parâmetros."""
+        t, x1, x2 = resolver_sistema_lote(self.params, (1.0, 1.0), 10.0, 100)
+        assert t.shape == (100,)
+        assert x1.shape == (3, 100)
+        assert x2.shape == (3, 100)
+
+    def test_condicoes_iniciais_por_sistema(self):
+        """Testa condições iniciais distintas para cada sistema."""
+        y0 = np.array([(1.0, 1.0), (2.0, 0.5), (0.5, 2.0)])
+        t, x1, x2 = resolver_sistema_lote(self.params, y0, 10.0, 100)
+        assert_allclose(x1[:, 0], y0[:, 0])
+        assert_allclose(x2[:, 0], y0[:, 1])
+
+    def test_equivale_a_resolver_sistema(self):
+        """Testa se cada linha coincide com a solução individual."""
+        t, x1, x2 = resolver_sistema_lote(self.params, (1.0, 1.0), 2.0, 100)
+        for i, (alpha, beta, gamma, delta) in enumerate(self.params):
+            _, x1_ref, x2_ref = resolver_sistema(
+                alpha, beta, gamma, delta, 1.0, 1.0, t_max=2.0, n_points=100
             )
-            assert len(t) > 0
-            assert np.all(np.isfinite(x1))
-            assert np.all(np.isfinite(x2))
-            assert np.all(x1 >= 0)
-            assert np.all(x2 >= 0)
+            assert_allclose(x1[i], x1_ref, atol=1e-5)
+            assert_allclose(x2[i], x2_ref, atol=1e-5)
+
+    @pytest.mark.parametrize("rk4", [_rk4_lv_lote, _rk4_lv_lote.py_func])
+    def test_rk4_lote_equivale_ao_individual(self, rk4):
+        """Testa se o RK4 em lote coincide com o RK4 de cada sistema."""
+        y0 = np.array([(1.0, 1.0), (2.0, 0.5), (0.5, 2.0)])
+        x1, x2 = rk4(self.params, y0, 2.0, 100)
+        for i, p in enumerate(self.params):
+            _, x1_ref, x2_ref = _rk4_lv(*p, *y0[i], 2.0, 100)
+            assert_allclose(x1[:, i], x1_ref, rtol=1e-12)
+            assert_allclose(x2[:, i], x2_ref, rtol=1e-12)
+
+    def test_metodo_rk4(self):
+        """Testa method="rk4" contra a integração LSODA em lote."""
+        t, x1, x2 = resolver_sistema_lote(self.params, (1.0, 1.0), 2.0, 2000, "rk4")
+        _, x1_ref, x2_ref = resolver_sistema_lote(self.params, (1.0, 1.0), 2.0, 2000)
+        assert x1.shape == (3, 2000)
+        assert_allclose(x1, x1_ref, atol=1e-5)
+        assert_allclose(x2, x2_ref, atol=1e-5)
+
+    def test_metodo_diffrax(self):
+        """Testa o integrador opcional do diffrax contra o LSODA em lote."""
+        pytest.importorskip("diffrax")
+        y0 = np.array([(1.0, 1.0), (2.0, 0.5), (0.5, 2.0)])
+        t, x1, x2 = resolver_sistema_lote(self.params, y0, 2.0, 100, "diffrax")
+        _, x1_ref, x2_ref = resolver_sistema_lote(self.params, y0, 2.0, 100)
+        assert x1.shape == (3, 100)
+        assert_allclose(x1, x1_ref, atol=1e-5)
+        assert_allclose(x2, x2_ref, atol=1e-5)
+
+    def test_metodo_desconhecido(self):
+        """Testa se um integrador desconhecido gera ValueError."""
+        with pytest.raises(ValueError, match="Método desconhecido"):
+            resolver_sistema_lote(self.params, (1.0, 1.0), method="euler")
+
+    @pytest.mark.parametrize("method", ["LSODA", "rk4"])
+    def test_n_points_invalido(self, method):
+        """Testa se n_points < 1 gera ValueError antes de chamar o integrador."""
+        with pytest.raises(ValueError, match="n_points"):
+            resolver_sistema_lote(self.params, (1.0, 1.0), 10.0, 0, method)
+
+    def test_rhs_python_equivale_a_compilado(self):
+        """Testa a versão Python do RHS em lote contra lotka_volterra."""
+        y = np.array([1.0, 2.0, 0.5, 1.5, 1.0, 0.5])
+        out = _lv_rhs_lote.py_func(0.0, y, self.params)
+        for i, p in enumerate(self.params):
+            assert_allclose(out[[i, i + 3]], lotka_volterra(0.0, y[[i, i + 3]], *p))
 
 
 class TestIntegracaoSistema:
     """Testes de integração do sistema completo."""
 
+    def test_importacao_como_lotka_volterra(self, tmp_path):
+        """Testa o módulo importado como ``lotka_volterra``, como na documentação."""
+        # Compila os kernels aqui, sob o nome ``src.lotka_volterra``.
+        resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 100)
+        resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 100, "rk4")
+        resolver_sistema_lote([(6.0, 2.0, 2.0, 3.0)], (1.0, 1.0), 10.0, 100, "rk4")
+
+        src = Path(__file__).parent.parent / "src"
+        codigo = (
+            "import sys\n"
+            f"sys.path.insert(0, {str(src)!r})\n"
+            "import lotka_volterra as lv\n"
+            "lv.resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 100)\n"
+            "lv.resolver_sistema(6.0, 2.0, 2.0, 3.0, 1.0, 1.0, 10.0, 100, 'rk4')\n"
+            "lv.resolver_sistema_lote([(6.0, 2.0, 2.0, 3.0)], (1.0, 1.0), 10.0, 100, 'rk4')\n"
+        )
+        resultado = subprocess.run(
+            [sys.executable, "-c", codigo],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert resultado.returncode == 0, resultado.stderr
+
     def test_equilibrio_e_estavel_no_ponto_de_equilibrio(self):
         """Testa se começando no equilíbrio o sistema permanece lá."""
         alpha, beta, gamma, delta = 6.0, 2.0, 2.0, 3.0
@@ -201,11 +533,9 @@ class TestIntegracaoSistema:
         assert_allclose(x1, x1_eq, rtol=1e-3, atol=1e-3)
         assert_allclose(x2, x2_eq, rtol=1e-3, atol=1e-3)
 
-    def test_conservacao_energia_orbita_fechada(self):
+    def test_conservacao_energia_orbita_fechada(self, solucao_longa):
         """Testa se a órbita é aproximadamente fechada."""
-        t, x1, x2 = resolver_sistema(
-            6.0, 2.0, 2.0, 3.0, 1.0, 1.0, t_max=50.0, n_points=5000
-        )
+        t, x1, x2 = solucao_longa
 
         x1_inicial = x1[0]
         x2_inicial = x2[0]
@@ -246,6 +576,14 @@ class TestCasosEspeciais:
         assert_allclose(x2, 0.0)
         assert np.all(x1 >= 1.0), "Presas devem crescer sem predadores"
 
+    @pytest.mark.parametrize("method", ["LSODA", "rk4"])
+    def test_condicao_inicial_zero_solucao_exata(self, method):
+        """Testa as soluções exponenciais exatas com uma população nula."""
+        t, x1, x2 = resolver_sistema(6.0, 2.0, 2.0, 3.0, 0.0, 1.5, 5.0, 50, method)
+        assert_allclose(x2, 1.5 * np.exp(-2.0 * t))
+        t, x1, x2 = resolver_sistema(6.0, 2.0, 2.0, 3.0, 0.5, 0.0, 5.0, 50, method)
+        assert_allclose(x1, 0.5 * np.exp(6.0 * t))
+
     def test_parametros_muito_pequenos(self):
         """Testa com parâmetros muito pequenos."""
         t, x1, x2 = resolver_sistema(0.1, 0.1, 0.1, 0.1, 1.0, 1.0, t_max=10.0)